@@ -1,10 +1,21 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from tavily import TavilyClient
 import openai
 from dotenv import load_dotenv
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit
+import asyncio
+import hashlib
+import io
+import json
 import os
+import random
 from typing import List, Dict, Any, Optional
 import time
+import diskcache
+import pybloom_live
+import tiktoken
 from pydantic import BaseModel, Field
 
 # Load environment variables
@@ -12,178 +23,489 @@ load_dotenv()
 
 # Initialize clients
 tavily_client = TavilyClient(api_key=os.environ['TAVILY_API_KEY'])
-openai.api_key = os.environ.get('OPENAI_API_KEY')
+openai_client = openai.AsyncOpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
 
 # Configuration
-QUERY_GENERATION_MODEL = "gpt-4o"
+# Query generation and gap analysis are short structural tasks, so they run
+# on the cheaper model; gpt-4o is reserved for the synthesis steps.
+QUERY_GENERATION_MODEL = "gpt-4o-mini"
 DEEP_RESEARCH_MODEL = "gpt-4o"
 MAX_QUERY_LENGTH = 400
 MAX_RETRIES = 3
 DELAY_BETWEEN_REQUESTS = 2
+MAX_BACKOFF_SECONDS = 30
 MAX_ITERATIONS = 3
+MAX_CONCURRENT_LLM_CALLS = 4
+SPECULATIVE_QUERY_OVERLAP = 0.5
+WORKER_COUNT = os.cpu_count() or 1
+
+# Cap concurrent OpenAI calls so parallel iterations stay within rate limits
+llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+class AsyncRateLimiter:
+    """Token bucket allowing `rate` acquisitions per `per` seconds.
+
+    Waiting is done with asyncio.sleep, so other requests on the event
+    loop keep running while a caller waits for a token.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens + (now - self._updated) * self.rate / self.per
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+# Each worker gets a 1/WORKER_COUNT share of the global Tavily budget, so
+# with one worker per CPU (see the launcher) the whole service still makes
+# at most one search per DELAY_BETWEEN_REQUESTS seconds
+search_limiter = AsyncRateLimiter(1, DELAY_BETWEEN_REQUESTS * WORKER_COUNT)
+
+# Shared encoder for trimming source content to a token budget
+token_encoder = tiktoken.encoding_for_model("gpt-4o")
+SOURCE_TOKEN_BUDGET = 500
+
+def trim_to_tokens(text: str, max_tokens: int = SOURCE_TOKEN_BUDGET) -> str:
+    """Truncate text to at most max_tokens model tokens."""
+    tokens = token_encoder.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return token_encoder.decode(tokens[:max_tokens])
+
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings dedup together:
+    lowercase scheme and host, no trailing slash or dot, no query/fragment."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower().rstrip('.'),
+        parts.path.rstrip('/'),
+        '',
+        '',
+    ))
+
+# Per-source summaries keyed by URL so a source is only summarized once,
+# even when it reappears in later iterations or in the final synthesis
+source_summary_cache: Dict[str, str] = {}
+
+# In-flight summarization tasks keyed by URL, so concurrent map phases
+# (e.g. the overlapped last-iteration and final reduces) await one call
+# instead of each summarizing the same new source
+source_summary_inflight: Dict[str, "asyncio.Task[str]"] = {}
+
+# Bloom filter of every URL summarized by this process; a cheap membership
+# probe decides whether the disk cache is worth consulting for sources
+# recurring across separate /research requests
+seen_url_filter = pybloom_live.ScalableBloomFilter(
+    initial_capacity=10_000, error_rate=1e-4
+)
+
+# On-disk completion cache keyed by a hash of the full request, so re-runs
+# and iterations with unchanged prompts skip the API call entirely
+llm_cache = diskcache.Cache("./.llm_cache")
+LLM_CACHE_TTL = 86400
+
+async def cached_completion(model: str, messages: List[Dict[str, str]],
+                            temperature: float, max_tokens: int,
+                            response_format: Optional[Dict[str, Any]] = None) -> str:
+    key = hashlib.sha256(json.dumps(
+        {"m": model, "msgs": messages, "t": temperature, "mt": max_tokens,
+         "rf": response_format},
+        sort_keys=True
+    ).encode()).hexdigest()
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return cached
+    kwargs = {"response_format": response_format} if response_format else {}
+    async with llm_semaphore:
+        response = await openai_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+    content = response.choices[0].message.content
+    llm_cache.set(key, content, expire=LLM_CACHE_TTL)
+    return content
+
+# Static instruction blocks sent as byte-identical system messages, with
+# the dynamic inputs appended as a short user message. Keeping the long
+# static text as a stable prefix lets OpenAI's automatic prompt caching
+# reuse it across calls.
+INITIAL_QUERY_INSTRUCTIONS = f"""You write comprehensive web search queries for market research.
+The query should:
+- Be specific enough to get relevant results
+- Include important industry keywords
+- Cover both broad trends and specific details
+- Be under {MAX_QUERY_LENGTH} characters
+Return only the query."""
+
+REFINEMENT_QUERY_INSTRUCTIONS = f"""Given a market research summary and its identified knowledge gaps,
+create a refined web search query that specifically addresses those gaps.
+The new query should:
+- Target the missing information specifically
+- Use precise terminology
+- Be under {MAX_QUERY_LENGTH} characters
+Return only the query."""
+
+GAP_ANALYSIS_INSTRUCTIONS = """Analyze the given market research summary and identify the 3 most
+important knowledge gaps or unanswered questions that would improve the
+research quality. Focus on:
+- Missing data points
+- Unclear trends
+- Lack of specific examples
+- Areas needing more depth"""
+
+SOURCE_SUMMARY_INSTRUCTIONS = """Summarize the key market research facts from the given source in a
+short paragraph. Keep every statistic, date and named entity."""
+
+SYNTHESIS_INSTRUCTIONS = """Synthesize a comprehensive summary from the given search results.
+Include:
+1. Key findings and statistics
+2. Trends and patterns
+3. Conflicting information
+4. Notable missing information
+Organize the summary clearly with headings."""
 
 app = FastAPI(title="Iterative Market Research API",
-              description="API for performing deep, iterative market research using AI-powered analysis")
+              description="API for performing deep, iterative market research using AI-powered analysis",
+              default_response_class=ORJSONResponse)
 
 class ResearchRequest(BaseModel):
     domain: str
     company_name: Optional[str] = Field(None, description="Specific company to focus on")
     metrics: Optional[List[str]] = None
     custom_operator: Optional[str] = None
+    stream: bool = Field(False, description="Stream the final analysis as server-sent events")
 
 class ResearchResponse(BaseModel):
     final_analysis: str
     iterations: List[Dict[str, Any]]
     all_sources: List[Dict[str, Any]]
 
-def generate_initial_query(domain: str, company_name: str = None, metrics: List[str] = None, custom_operator: str = None) -> str:
-    prompt = f"""
-    Create a comprehensive web search query for market research about: {domain}
-    {f"focusing on company: {company_name}" if company_name else ""}
-    {f"analyzing metrics: {', '.join(metrics)}" if metrics else ""}
-    {f"using analysis method: {custom_operator}" if custom_operator else ""}
-    The query should:
-    - Be specific enough to get relevant results
-    - Include important industry keywords
-    - Cover both broad trends and specific details
-    - Be under {MAX_QUERY_LENGTH} characters
-    """
-    response = openai.chat.completions.create(
+async def generate_initial_query(domain: str, company_name: str = None, metrics: List[str] = None, custom_operator: str = None) -> str:
+    details = f"Research topic: {domain}"
+    if company_name:
+        details += f"\nFocus company: {company_name}"
+    if metrics:
+        details += f"\nMetrics to analyze: {', '.join(metrics)}"
+    if custom_operator:
+        details += f"\nAnalysis method: {custom_operator}"
+    content = await cached_completion(
         model=QUERY_GENERATION_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=[
+            {"role": "system", "content": INITIAL_QUERY_INSTRUCTIONS},
+            {"role": "user", "content": details},
+        ],
         temperature=0.4,
         max_tokens=200,
     )
-    return response.choices[0].message.content.strip()
-
-def generate_refinement_query(domain: str, previous_summary: str, knowledge_gaps: List[str]) -> str:
-    prompt = f"""
-    Based on the following research summary and identified knowledge gaps about {domain},
-    create a refined web search query that specifically addresses these gaps:
-    Previous Summary:
-    {previous_summary}
-    Knowledge Gaps:
-    {', '.join(knowledge_gaps)}
-    The new query should:
-    - Target the missing information specifically
-    - Use precise terminology
-    - Be under {MAX_QUERY_LENGTH} characters
-    """
-    response = openai.chat.completions.create(
+    return content.strip()
+
+async def generate_refinement_query(domain: str, previous_summary: str, knowledge_gaps: List[str]) -> str:
+    details = (
+        f"Domain: {domain}\n"
+        f"Previous Summary:\n{previous_summary}\n"
+        f"Knowledge Gaps: {', '.join(knowledge_gaps)}"
+    )
+    content = await cached_completion(
         model=QUERY_GENERATION_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=[
+            {"role": "system", "content": REFINEMENT_QUERY_INSTRUCTIONS},
+            {"role": "user", "content": details},
+        ],
         temperature=0.5,
         max_tokens=200,
     )
-    return response.choices[0].message.content.strip()
-
-def identify_knowledge_gaps(domain: str, summary: str) -> List[str]:
-    prompt = f"""
-    Analyze this market research summary about {domain} and identify the 3 most important
-    knowledge gaps or unanswered questions that would improve the research quality.
-    Focus on:
-    - Missing data points
-    - Unclear trends
-    - Lack of specific examples
-    - Areas needing more depth
-    Summary:
-    {summary}
-    Return only a bulleted list of the key gaps, nothing else.
-    """
-    response = openai.chat.completions.create(
-        model=DEEP_RESEARCH_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+    return content.strip()
+
+# Structured-output schema for identify_knowledge_gaps: the model can only
+# return {"gaps": [...]}, so no tokens are spent on bullets or prose
+GAPS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "gaps",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "gaps": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "maxItems": 3,
+                }
+            },
+            "required": ["gaps"],
+        },
+    },
+}
+
+async def identify_knowledge_gaps(domain: str, summary: str) -> List[str]:
+    content = await cached_completion(
+        model=QUERY_GENERATION_MODEL,
+        messages=[
+            {"role": "system", "content": GAP_ANALYSIS_INSTRUCTIONS},
+            {"role": "user", "content": f"Domain: {domain}\nSummary:\n{summary}"},
+        ],
         temperature=0.3,
-        max_tokens=200,
+        max_tokens=120,
+        response_format=GAPS_RESPONSE_FORMAT,
+    )
+    try:
+        return json.loads(content)["gaps"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        # max_tokens can truncate the JSON mid-array; treat that as no
+        # gaps found so the iteration skips refinement instead of failing
+        return []
+
+async def summarize_source(source: Dict[str, Any], domain: str) -> str:
+    url = source.get('url')
+    if not url:
+        # Without a URL there is no identity to cache or coalesce on; a
+        # sentinel key would serve one source's summary for another.
+        # cached_completion still dedups byte-identical content.
+        return await summarize_source_uncached(source, domain, None)
+    url = canonicalize_url(url)
+    cached = source_summary_cache.get(url)
+    if cached is not None:
+        return cached
+    inflight = source_summary_inflight.get(url)
+    if inflight is not None:
+        return await inflight
+    task = asyncio.ensure_future(summarize_source_uncached(source, domain, url))
+    source_summary_inflight[url] = task
+    try:
+        return await task
+    finally:
+        source_summary_inflight.pop(url, None)
+
+async def summarize_source_uncached(source: Dict[str, Any], domain: str, url: Optional[str]) -> str:
+    if url and url in seen_url_filter:
+        disk_cached = llm_cache.get(f"summary:{url}")
+        if disk_cached is not None:
+            source_summary_cache[url] = disk_cached
+            return disk_cached
+    details = (
+        f"Domain: {domain}\n"
+        f"Title: {source.get('title', 'Untitled')}\n"
+        f"Content: {trim_to_tokens(source.get('content', 'No content'))}"
     )
-    return [line.strip('- ').strip() for line in response.choices[0].message.content.split('\n') if line.strip()]
-
-def summarize_results(sources: List[Dict[str, Any]], domain: str, metrics: List[str] = None) -> str:
-    combined_text = "\n\n".join(
-        f"Source {i+1}: {source.get('title', 'Untitled')}\n"
-        f"URL: {source.get('url', 'No URL')}\n"
-        f"Content: {source.get('content', 'No content')[:2000]}..."
-        for i, source in enumerate(sources)
+    content = await cached_completion(
+        model=DEEP_RESEARCH_MODEL,
+        messages=[
+            {"role": "system", "content": SOURCE_SUMMARY_INSTRUCTIONS},
+            {"role": "user", "content": details},
+        ],
+        temperature=0.2,
+        max_tokens=300,
     )
+    summary = content.strip()
+    if url:
+        source_summary_cache[url] = summary
+        seen_url_filter.add(url)
+        llm_cache.set(f"summary:{url}", summary, expire=LLM_CACHE_TTL)
+    return summary
+
+async def build_synthesis_messages(sources: List[Dict[str, Any]], domain: str, metrics: List[str] = None) -> List[Dict[str, str]]:
+    # Map phase: summarize each source once (cache hits are free), then
+    # reduce over the short per-source summaries instead of raw contents.
+    summaries = await asyncio.gather(
+        *(summarize_source(source, domain) for source in sources)
+    )
+    titles = [source.get('title', 'Untitled') for source in sources]
+    urls = [source.get('url', 'No URL') for source in sources]
+    # Write the combined block through one buffer instead of materializing
+    # an intermediate f-string per source and joining them afterwards
+    buf = io.StringIO()
+    for i, (title, url, summary) in enumerate(zip(titles, urls, summaries)):
+        if i:
+            buf.write("\n\n")
+        buf.write(f"Source {i+1}: ")
+        buf.write(title)
+        buf.write("\nURL: ")
+        buf.write(url)
+        buf.write("\nSummary: ")
+        buf.write(summary)
+    combined_text = buf.getvalue()
     metrics_context = f" focusing on {', '.join(metrics)}" if metrics else ""
-    prompt = f"""
-    Synthesize a comprehensive summary from these search results about {domain}{metrics_context}:
-    {combined_text}
-    Include:
-    1. Key findings and statistics
-    2. Trends and patterns
-    3. Conflicting information
-    4. Notable missing information
-    Organize the summary clearly with headings.
-    """
-    response = openai.chat.completions.create(
+    return [
+        {"role": "system", "content": SYNTHESIS_INSTRUCTIONS},
+        {"role": "user", "content": f"Domain: {domain}{metrics_context}\n{combined_text}"},
+    ]
+
+async def summarize_results(sources: List[Dict[str, Any]], domain: str, metrics: List[str] = None) -> str:
+    messages = await build_synthesis_messages(sources, domain, metrics)
+    content = await cached_completion(
         model=DEEP_RESEARCH_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=messages,
         temperature=0.2,
         max_tokens=1500,
     )
-    return response.choices[0].message.content.strip()
+    return content.strip()
+
+async def stream_summarize(sources: List[Dict[str, Any]], domain: str, metrics: List[str] = None):
+    """Yield final-analysis tokens as they arrive from the model."""
+    messages = await build_synthesis_messages(sources, domain, metrics)
+    async with llm_semaphore:
+        stream = await openai_client.chat.completions.create(
+            model=DEEP_RESEARCH_MODEL,
+            messages=messages,
+            temperature=0.2,
+            max_tokens=1500,
+            stream=True,
+        )
+        async for chunk in stream:
+            yield chunk.choices[0].delta.content or ""
+
+def is_retryable_error(exc: Exception) -> bool:
+    """Retry rate limits, server errors and transient failures; fail fast
+    on other client errors (auth, bad request, not found)."""
+    status = getattr(exc, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    if status is None:
+        return True
+    return status == 429 or status >= 500
 
-def search_with_retry(query: str) -> List[Dict[str, Any]]:
+async def search_with_retry(query: str) -> List[Dict[str, Any]]:
     for attempt in range(MAX_RETRIES):
         try:
-            response = tavily_client.search(
-                query=query,
-                search_depth="advanced",
-                include_raw_content=True,
-                max_results=7
-            )
+            async with search_limiter:
+                response = await asyncio.to_thread(
+                    tavily_client.search,
+                    query=query,
+                    search_depth="advanced",
+                    include_raw_content=True,
+                    max_results=7
+                )
             return response.get("results", [])
         except Exception as e:
             print(f"Attempt {attempt + 1} failed: {str(e)}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-            else:
+            if not is_retryable_error(e) or attempt >= MAX_RETRIES - 1:
                 raise
+            # Exponential backoff with full jitter, capped at MAX_BACKOFF_SECONDS
+            await asyncio.sleep(min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random()))
     return []
 
-@app.post("/research", response_model=ResearchResponse, tags=["Market Research"])
+def query_overlap(a: str, b: str) -> float:
+    """Word-set Jaccard similarity between two search queries."""
+    a_words = set(a.lower().split())
+    b_words = set(b.lower().split())
+    if not a_words or not b_words:
+        return 0.0
+    return len(a_words & b_words) / len(a_words | b_words)
+
+@app.post("/research", response_model=ResearchResponse, tags=["Market Research"],
+          responses={200: {
+              "description": "Research report as JSON, or as server-sent events when stream=true",
+              "content": {
+                  "application/json": {},
+                  "text/event-stream": {"schema": {"type": "string"}},
+              },
+          }})
 async def perform_iterative_research(request: ResearchRequest):
+    """Run iterative market research on the requested domain.
+
+    By default the full report is returned as JSON. With stream=true the
+    response is a server-sent event stream: a `metadata` event carrying the
+    iterations and sources as JSON, unnamed `data` events with the final
+    analysis token by token, then a terminal `done` event - or an `error`
+    event if the synthesis fails mid-stream.
+    """
     try:
         all_sources = []
+        seen_urls = set()
         iterations = []
         current_summary = ""
-        query = generate_initial_query(
+        final_analysis = None
+        query = await generate_initial_query(
             request.domain,
             request.company_name,
             request.metrics,
             request.custom_operator
         )
+        speculative_query = None
+        speculative_sources = []
         for iteration in range(MAX_ITERATIONS):
             print(f"Starting iteration {iteration + 1} with query: {query}")
             try:
-                sources = search_with_retry(query)
-                all_sources.extend(sources)
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-                unique_sources = []
-                seen_urls = set()
-                for source in all_sources:
-                    if source['url'] not in seen_urls:
-                        seen_urls.add(source['url'])
-                        unique_sources.append(source)
-                all_sources = unique_sources
+                if (speculative_query is not None
+                        and speculative_sources
+                        and query_overlap(query, speculative_query) >= SPECULATIVE_QUERY_OVERLAP):
+                    sources = speculative_sources
+                else:
+                    sources = await search_with_retry(query)
+                speculative_query = None
+                # Stage URLs once so each source dict is only probed a single
+                # time; seen_urls is updated as we go so duplicates within
+                # the same batch are dropped too
+                urls = [source.get('url') for source in sources]
+                urls = [canonicalize_url(url) if url else None for url in urls]
+                for i, url in enumerate(urls):
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        all_sources.append(sources[i])
                 if not sources:
                     if iteration == 0:
                         raise HTTPException(status_code=404, detail="No relevant sources found")
                     break
-                current_summary = summarize_results(
-                    sources,
-                    request.domain,
-                    request.metrics
-                )
                 if iteration < MAX_ITERATIONS - 1:
-                    gaps = identify_knowledge_gaps(request.domain, current_summary)
+                    current_summary = await summarize_results(
+                        sources,
+                        request.domain,
+                        request.metrics
+                    )
+                    gaps = await identify_knowledge_gaps(request.domain, current_summary)
                     if gaps:
-                        query = generate_refinement_query(
+                        # Speculatively search a query built straight from the
+                        # gaps while the model rewrites those same gaps into
+                        # the refined query; the two share most of their
+                        # terms, so the prefetch is usually reusable.
+                        speculative_query = f"{request.domain} {' '.join(gaps)}"[:MAX_QUERY_LENGTH]
+                        speculative_task = asyncio.create_task(search_with_retry(speculative_query))
+                        query = await generate_refinement_query(
                             request.domain,
                             current_summary,
                             gaps
                         )
+                        try:
+                            speculative_sources = await speculative_task
+                        except Exception as e:
+                            print(f"Speculative search failed: {str(e)}")
+                            speculative_query = None
+                            speculative_sources = []
+                elif request.stream:
+                    # Streaming clients get the final synthesis token by
+                    # token after the loop, so only the per-iteration
+                    # summary is needed here.
+                    current_summary = await summarize_results(
+                        sources, request.domain, request.metrics
+                    )
+                else:
+                    # Last iteration: the per-iteration summary and the final
+                    # synthesis over all sources are independent, so overlap them.
+                    current_summary, final_analysis = await asyncio.gather(
+                        summarize_results(sources, request.domain, request.metrics),
+                        summarize_results(all_sources, request.domain, request.metrics)
+                    )
                 iterations.append({
                     "iteration": iteration + 1,
                     "query": query,
@@ -196,11 +518,29 @@ async def perform_iterative_research(request: ResearchRequest):
                 if iteration == 0:
                     raise HTTPException(status_code=500, detail=f"Initial research failed: {str(e)}")
                 break
-        final_analysis = summarize_results(
-            all_sources,
-            request.domain,
-            request.metrics
-        )
+        if request.stream:
+            async def event_stream():
+                # JSON preamble with the non-streamed fields, then the
+                # final analysis token by token as the model produces it
+                preamble = json.dumps({"iterations": iterations, "all_sources": all_sources})
+                yield f"event: metadata\ndata: {preamble}\n\n"
+                try:
+                    async for token in stream_summarize(all_sources, request.domain, request.metrics):
+                        yield f"data: {json.dumps(token)}\n\n"
+                except Exception as e:
+                    # The 200 is already on the wire, so a terminal error
+                    # frame is the only way to tell clients the stream
+                    # failed rather than completed
+                    yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+                    return
+                yield "event: done\ndata: {}\n\n"
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+        if final_analysis is None:
+            final_analysis = await summarize_results(
+                all_sources,
+                request.domain,
+                request.metrics
+            )
         return {
             "final_analysis": final_analysis,
             "iterations": iterations,
@@ -211,4 +551,11 @@ async def perform_iterative_research(request: ResearchRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=WORKER_COUNT,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -11,7 +11,10 @@
 # response = requests.post(url, json=data)
 # print(response.json()["detailed_analysis"])
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import time
 from typing import Optional, List
 
@@ -19,6 +22,21 @@ from typing import Optional, List
 API_URL = "http://localhost:8000/research"  # Update if hosted elsewhere
 DEFAULT_TIMEOUT = 300  # 5 minutes for long-running research
 
+# Shared session so repeated calls reuse keep-alive connections instead of
+# paying a TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
 def conduct_market_research(
     domain: str,
     company_name: Optional[str] = None,
@@ -52,15 +70,15 @@ def conduct_market_research(
 
     try:
         start_time = time.time()
-        response = requests.post(
+        response = _SESSION.post(
             API_URL,
             json=payload,
-            headers={"Content-Type": "application/json"},
             timeout=timeout
         )
         response.raise_for_status()
         
-        data = response.json()
+        # orjson parses multi-MB reports several times faster than stdlib json
+        data = orjson.loads(response.content)
         processing_time = time.time() - start_time
         
         # Enhance response with timing info
@@ -127,8 +145,8 @@ def save_full_report(results: dict, filename: Optional[str] = None):
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"market_research_{timestamp}.json"
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     
     print(f"\nFull report saved to: {filename}")
 